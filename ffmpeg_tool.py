@@ -10,6 +10,7 @@ While this is a functional prototype, the goal is to evolve it into a fully
 fledged Griptape extension with improved structure, modularity, and integration.
 
 You'll need to have FFmpeg and FFprobe installed for these tools to function properly.
+If PyAV (av>=10.0) is installed, probing and stream-copy splits run in-process instead.
 
 Author: Jason Osipa
 GitHub: https://github.com/griptapeOsipa
@@ -20,7 +21,8 @@ Example usage:
 import random
 from griptape.video_tools.tools.ffmpeg_tool.tool import (
     VideoSegmentCalculatorTool, VideoTimecodeOverlayTool,
-    VideoSplitterTool, VideoInfoTool, AudioExtractorTool
+    VideoSplitterTool, VideoInfoTool, AudioExtractorTool,
+    VideoProcessingPipelineTool
 )
 from griptape.video_tools.utils.env_utils import get_env_var
 from griptape.tasks import PromptTask
@@ -52,6 +54,7 @@ task = PromptTask(
         AudioExtractorTool(),
         VideoSplitterTool(),
         VideoInfoTool(),
+        VideoProcessingPipelineTool(),
     ]
 )
 
@@ -61,8 +64,23 @@ print(result)
 
 
 import subprocess
+import asyncio
+import shutil
+import json
 import os
+import re
+import math
+import time
 
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 from schema import Literal, Optional, Schema, Or
 from typing import Union
 
@@ -70,11 +88,330 @@ from griptape.utils.decorators import activity
 from griptape.artifacts import ErrorArtifact, TextArtifact, InfoArtifact
 from griptape.tools import BaseTool
 
+try:
+    import av
+except ImportError:
+    av = None
+
+
+_TIMECODE_FILTER = r"drawtext=text='%{pts\:hms}':fontsize='48*(w/1920)':fontcolor=white:x=(w-text_w-text_h*2):y=(h-text_h-text_h*2)"
+
+# High-quality audio extraction
+_AUDIO_EXTRACT_ARGS = ( "-q:a", "0", "-map", "a" )
+
+# Concurrent NVENC encode sessions allowed per GPU on consumer cards
+_NVENC_MAX_SESSIONS = 2
+
+# Concurrent libx264 re-encodes, each already threads across every core so more only adds contention
+_X264_MAX_JOBS = 2
+
+# Outputs a single fused ffmpeg run may open, each holds its own encoder and frame queues
+_FUSED_MAX_OUTPUTS = 8
+
+
+async def _tail(stream: asyncio.StreamReader, lines: deque) -> None:
+    # ffmpeg separates progress updates with \r, so split on either line ending
+    buf = b""
+    while chunk := await stream.read(65536):
+        *complete, buf = re.split(rb"[\r\n]", buf + chunk)
+        lines.extend(line for line in complete if line)
+    if buf:
+        lines.append(buf)
+
+
+async def _run_async(cmd: list, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    '''
+    Runs cmd without blocking the event loop. stdout is discarded unless capture is set, and only the
+    last 50 lines of stderr are kept, so long encodes can't fill a pipe or grow memory.
+
+    Returns:
+    A CompletedProcess with stdout and stderr as bytes, raises CalledProcessError on failure if check is set.
+    '''
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    # Both pipes were requested above, the asserts only narrow the Optional attributes
+    assert proc.stderr is not None
+    lines = deque(maxlen=50)
+    if capture:
+        assert proc.stdout is not None
+        stdout, _ = await asyncio.gather(proc.stdout.read(), _tail(proc.stderr, lines))
+    else:
+        stdout = None
+        await _tail(proc.stderr, lines)
+    returncode = await proc.wait()
+
+    stderr = b"\n".join(lines)
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+def _run_sync(coro):
+    # Activities are called synchronously; if the caller already runs an event loop, drive ours on a worker thread
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            return ex.submit(asyncio.run, coro).result()
+    return asyncio.run(coro)
+
+
+def _run(cmd: list, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    return _run_sync(_run_async(cmd, check, capture))
+
+
+def _tmp_path(out: str, i: int = 0) -> str:
+    # Keep the real extension last so ffmpeg still picks the muxer from it
+    root, ext = os.path.splitext(out)
+    return f"{root}.tmp.{os.getpid()}.{i}{ext}"
+
+
+@contextmanager
+def _atomic_output(out: str, i: int = 0):
+    '''
+    Yields a temporary path to write instead of out, which is moved over out with os.replace only if the
+    block completes. A failed run never clobbers a previous result, and parallel workers never see a partial file.
+    '''
+    tmp = _tmp_path(out, i)
+    try:
+        yield tmp
+        os.replace(tmp, out)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _av_info(path: str) -> dict:
+    if av is None:
+        raise ImportError("PyAV is not installed")
+    with av.open(path) as c:
+        if c.duration is None:
+            raise ValueError(f"No duration reported for {path}")
+        streams = []
+        for s in c.streams:
+            ctx  = s.codec_context
+            rate = getattr(s, "base_rate", None) if s.type == "video" else None
+            streams.append(
+                {
+                    "type":   s.type,
+                    "codec":  ctx.name if ctx else None,
+                    "width":  getattr(ctx, "width",  None) if s.type == "video" else None,
+                    "height": getattr(ctx, "height", None) if s.type == "video" else None,
+                    "fps":    f"{rate.numerator}/{rate.denominator}" if rate else None,
+                }
+            )
+        return {"duration": c.duration / av.time_base, "streams": streams}
+
+
+def _av_copy(mov: str, start: float, end: float, out: str) -> None:
+    '''
+    Stream-copies [start, end) of the video and audio streams into out, demuxing and remuxing in-process.
+    start is expected to sit on a keyframe.
+    '''
+    if av is None:
+        raise ImportError("PyAV is not installed")
+    with av.open(mov) as src, av.open(out, "w") as dst:
+        streams = [s for s in src.streams if s.type in ("video", "audio")]
+        # PyAV < 14 only has add_stream(template=...)
+        add     = getattr(dst, "add_stream_from_template", None) or (lambda s: dst.add_stream(template=s))  # pyright: ignore
+        mapping = {s.index: add(s) for s in streams}
+
+        # Times are relative to the container start, like ffmpeg's -ss and _probe_keyframes
+        origin = (src.start_time or 0) / av.time_base
+        start += origin
+        end   += origin
+        if start > origin:
+            # MPEG-TS seeks can land a few frames past the target, so aim a second early
+            src.seek(int(max(origin, start - 1) * av.time_base), backward=True, any_frame=False)
+
+        done, keyed = set(), set()
+        for pkt in src.demux(streams):
+            if pkt.pts is None or pkt.dts is None:
+                continue
+            t = float(pkt.pts * pkt.time_base)
+            if t >= end:
+                done.add(pkt.stream.index)
+                if len(done) == len(streams):
+                    break
+                continue
+            if t < start - 1e-3:
+                continue
+            if pkt.stream.type == "video" and pkt.stream.index not in keyed:
+                # Never open a clip on a frame that depends on one we dropped
+                if not pkt.is_keyframe:
+                    continue
+                if t > start + 1e-3:
+                    # The keyframe at start was skipped, let the ffmpeg cli cut this one
+                    raise ValueError(f"Seek overshot {start - origin}s in {mov}")
+                keyed.add(pkt.stream.index)
+            shift      = int(start / pkt.time_base)
+            pkt.pts   -= shift
+            pkt.dts   -= shift
+            pkt.stream = mapping[pkt.stream.index]
+            dst.mux(pkt)
+
+
+@lru_cache(maxsize=256)
+def _probe_info(path: str, mtime: float, size: int) -> dict:
+    '''
+    Returns:
+    Duration in seconds plus per-stream codec, size and frame rate, in-process with PyAV when available,
+    otherwise from a single ffprobe call.
+    mtime and size are only part of the cache key, so a file rewritten in place is probed again.
+    '''
+    if av is not None:
+        try:
+            return _av_info(path)
+        except (av.FFmpegError, ValueError):
+            pass
+
+    cmd =   [
+                "ffprobe", "-v", "error", "-print_format", "json",
+                "-show_format", "-show_streams",
+                path,
+            ]
+    result = _run(cmd, capture=True)
+    try:
+        info     = json.loads(result.stdout)
+        duration = float(info["format"]["duration"])
+    except (ValueError, KeyError) as e:
+        raise ValueError(f"Unexpected ffprobe output ({e!r}): {result.stdout.decode(errors='replace')}") from e
+    return  {
+                "duration": duration,
+                "streams": [
+                    {
+                        "type":   s.get("codec_type"),
+                        "codec":  s.get("codec_name"),
+                        "width":  s.get("width"),
+                        "height": s.get("height"),
+                        "fps":    s.get("r_frame_rate"),
+                    }
+                    for s in info.get("streams", [])
+                ],
+            }
+
+
+def _av_keyframes(path: str) -> list:
+    if av is None:
+        raise ImportError("PyAV is not installed")
+    with av.open(path) as c:
+        if not c.streams.video:
+            return []
+        origin = (c.start_time or 0) / av.time_base
+        return [
+            float(pkt.pts * pkt.time_base) - origin
+            for pkt in c.demux(c.streams.video[0])
+            if pkt.is_keyframe and pkt.pts is not None
+        ]
+
+
+@lru_cache(maxsize=256)
+def _probe_keyframes(path: str, mtime: float, size: int) -> tuple:
+    '''
+    Returns:
+    Sorted keyframe timestamps (seconds) of the first video stream, read from packet flags so nothing is decoded.
+    Times are relative to the container start time, like -ss and segment times, so MPEG-TS and other
+    streams that don't start at zero line up.
+    Cached on the same (path, mtime, size) key as _probe_info.
+    '''
+    if av is not None:
+        try:
+            return tuple(sorted(_av_keyframes(path)))
+        except (av.FFmpegError, ValueError):
+            pass
+
+    # csv keeps the section name in front, so packet and format lines can share one call
+    cmd =   [
+                "ffprobe", "-v", "error", "-select_streams", "v:0",
+                "-show_entries", "packet=pts_time,flags:format=start_time", "-of", "csv",
+                path,
+            ]
+    result = _run(cmd, check=False, capture=True)
+    origin, times = 0.0, []
+    for line in result.stdout.decode().split():
+        fields = line.split(",")
+        try:
+            if fields[0] == "format" and len(fields) > 1:
+                origin = float(fields[1])
+            elif fields[0] == "packet" and len(fields) > 2 and "K" in fields[2]:
+                times.append(float(fields[1]))
+        except ValueError:
+            continue
+    return tuple(sorted(t - origin for t in times))
+
+
+def _probe(mov: str) -> dict:
+    st = os.stat(mov)
+    return _probe_info(os.path.abspath(mov), st.st_mtime, st.st_size)
+
+
+def _frame_interval(info: dict | None, default: float = 0.01) -> float:
+    '''
+    Returns:
+    Seconds per frame of the first video stream with a usable frame rate, or default if there is none.
+    '''
+    for s in (info or {}).get("streams", []):
+        if s["type"] == "video" and s["fps"]:
+            try:
+                return 1 / float(Fraction(s["fps"]))
+            except (ValueError, ZeroDivisionError):
+                continue
+    return default
+
+
+@lru_cache(maxsize=None)
+def _detect_hwaccel() -> bool:
+    '''
+    Returns:
+    True if ffmpeg can decode with CUDA and encode with NVENC, probed once per process.
+    '''
+    try:
+        accels   = _run(["ffmpeg", "-hide_banner", "-hwaccels"], capture=True).stdout.decode()
+        encoders = _run(["ffmpeg", "-hide_banner", "-encoders"], capture=True).stdout.decode()
+        if "cuda" not in accels.split() or "h264_nvenc" not in encoders:
+            return False
+        # Stock distro builds list both without an NVIDIA GPU present, so prove it with a 1 frame encode
+        _run([
+            "ffmpeg", "-hide_banner", "-f", "lavfi", "-i", "color=s=256x256",
+            "-frames:v", "1", "-c:v", "h264_nvenc", "-f", "null", "-",
+        ])
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def _run_hw(hw_cmd: list, cpu_cmd: list) -> subprocess.CompletedProcess:
+    '''
+    Runs hw_cmd when NVENC is available, otherwise or if it fails, cpu_cmd.
+    A failure here is usually the source (e.g. a codec NVDEC can't decode), so NVENC stays on for later calls.
+    '''
+    if _detect_hwaccel():
+        try:
+            return _run(hw_cmd)
+        except subprocess.CalledProcessError:
+            pass
+    return _run(cpu_cmd)
+
+
+def _invalid_segments(segments: list, duration: float | None = None, epsilon: float = 0.05) -> list:
+    '''
+    Returns:
+    The segments that don't satisfy 0 <= start < end <= duration (end is unbounded if duration is unknown).
+    '''
+    limit = math.inf if duration is None else duration + epsilon
+    return [ s for s in segments if not ( 0 <= s["start"] < s["end"] <= limit ) ]
+
 
 class VideoInfoTool(BaseTool):
     @activity(
         config={
-            "description": "Extracts video metadata (e.g., duration) using ffprobe.",
+            "description": "Extracts video metadata using ffprobe: duration in seconds, and codec, "
+                           "width, height and frame rate for each stream.",
             "schema": Schema(
                 {
                     Literal(
@@ -88,25 +425,27 @@ class VideoInfoTool(BaseTool):
     def get_video_info(self, params: dict) -> Union[InfoArtifact, ErrorArtifact]:
         """
         Returns:
-        A dictionary with video information (duration in seconds).
+        A dictionary with video information (duration in seconds, and a list of streams).
         """
         mov = params[ 'values' ][ 'mov' ]
 
         if not os.path.exists(mov):
             return ErrorArtifact( f"File not found: {mov}" )
+        if not os.access(mov, os.R_OK):
+            return ErrorArtifact( f"File not readable: {mov}" )
 
-        cmd =   [
-                    "ffprobe", "-v", "error", "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    mov,
-                ]
-        try:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            duration = float(result.stdout.strip())
-            return InfoArtifact({"duration": duration})
-
-        except Exception as e:
-            return ErrorArtifact( f"Error retrieving video duration: {e}" )
+        error = None
+        for _ in range(2):
+            try:
+                return InfoArtifact(_probe(mov))
+            except subprocess.CalledProcessError as e:
+                # ffprobe occasionally races on network mounts, give it one more go
+                error = f"{e} {e.stderr.decode(errors='replace')}"
+                time.sleep(0.1)
+            except (FileNotFoundError, PermissionError, ValueError) as e:
+                # ValueError carries the raw ffprobe output for corrupt or unsupported files
+                return ErrorArtifact( f"Error retrieving video info: {e}" )
+        return ErrorArtifact( f"Error retrieving video info: {error}" )
 
 
 class VideoSegmentCalculatorTool(BaseTool):
@@ -127,6 +466,10 @@ class VideoSegmentCalculatorTool(BaseTool):
                         "value",
                         "Value associated with the method",
                     ): Or( int, float ),
+                    Literal(
+                        "fps",
+                        "Optional frame rate of the original video clip, provided by VideoInfoTool",
+                    ): Optional( Or( int, float, str ) ),
                 }
             ),
         }
@@ -139,35 +482,210 @@ class VideoSegmentCalculatorTool(BaseTool):
         duration = params[ 'values' ][ 'duration' ]
         method   = params[ 'values' ][ 'method'   ]
         value    = params[ 'values' ][ 'value'    ]
+        fps      = params.get('values', {}).get( 'fps' )
         
         if not duration or not method or not value:
             return ErrorArtifact("Missing required inputs: 'duration', 'method', or 'value'.")
 
-        segments = []
+        if value <= 0:
+            return ErrorArtifact( f"Invalid value: {value}. It must be greater than zero." )
+
         if method == "equal":
-            num_segments = value
-            segment_duration = duration / num_segments
-            for i in range(num_segments):
-                start = i * segment_duration
-                end   = min( start + segment_duration, duration )
-                segments.append( { "start": start, "end": end } )
+            num_segments = int( value )
+            if num_segments < 1:
+                return ErrorArtifact( f"Invalid value: {value}. 'equal' needs at least one segment." )
+            if fps:
+                try:
+                    frames = math.ceil( duration * float( Fraction( str(fps) ) ) )
+                except (ValueError, ZeroDivisionError):
+                    frames = None
+                if frames and num_segments > frames:
+                    return ErrorArtifact( f"Invalid value: {value}. The clip only has {frames} frames." )
+            edges  = np.linspace( 0, duration, num_segments + 1 )
+            starts, ends = edges[:-1], edges[1:]
         elif method == "duration":
-            segment_duration = value
-            start = 0
-            while start < duration:
-                end = min( start + segment_duration, duration )
-                segments.append( { "start": start, "end": end } )
-                start += segment_duration
+            # Count the chunks first, float arange can add a zero-length tail (e.g. 2.1 in 0.3 steps)
+            count  = math.ceil( duration / value - 1e-9 )
+            starts = np.arange( count ) * value
+            ends   = np.minimum( starts + value, duration )
         else:
             return ErrorArtifact( f"Invalid method: {method}. Use 'equal' or 'duration'." )
 
+        segments = [ { "start": float(s), "end": float(e) } for s, e in zip( starts, ends ) ]
+
         return InfoArtifact( { "segments": segments } )
 
 
 class VideoSplitterTool(BaseTool):
+    def _keyframes(self, mov: str) -> list:
+        '''
+        Returns:
+        Sorted keyframe timestamps (seconds) of the first video stream, empty if they can't be probed.
+        '''
+        try:
+            st = os.stat(mov)
+            return list( _probe_keyframes( os.path.abspath(mov), st.st_mtime, st.st_size ) )
+        except OSError:
+            # No ffprobe on PATH, or the file went away
+            return []
+
+    def _build_cmd(self, mov: str, start: float, end: float, out: str, mode: str,
+                   audio: str = "copy", duration: float | None = None, preset: str = "veryfast") -> list:
+        if mode == "copy":
+            # Head or tail aligned cuts need no seek or no duration limit
+            seek  = [ "-ss", str(start) ] if start > 0 else []
+            limit = [ "-t", str(end-start) ] if duration is None or end < duration - 0.05 else []
+            return [
+                "ffmpeg", "-y", *seek,
+                "-i", mov, *limit,
+                "-c", "copy", "-avoid_negative_ts", "1",
+                out,
+            ]
+        # Re-encodes seek in two steps: a cheap input seek to 10s before the cut skips past the
+        # prior keyframe without decoding, then a short output seek and absolute -to land exactly
+        pre  = max( 0, start - 10 )
+        trim = [ "-ss", str(start-pre), "-to", str(end-pre) ]
+
+        # Audio cut points needn't land on audio frames, so copy it unless the container refuses
+        acodec = [ "-c:a", "copy" ] if audio == "copy" else [ "-c:a", "aac", "-b:a", "192k" ]
+
+        # -pix_fmt must not be combined with -hwaccel_output_format cuda, frames stay in VRAM
+        if mode == "nvenc":
+            return [
+                "ffmpeg", "-y", "-hwaccel", "cuda", "-hwaccel_output_format", "cuda",
+                "-extra_hw_frames", "2", "-c:v", "h264_cuvid",
+                "-ss", str(pre), "-i", mov, *trim,
+                "-c:v", "h264_nvenc", "-preset", "p4", *acodec, "-avoid_negative_ts", "1",
+                out,
+            ]
+        return [
+            "ffmpeg", "-y", "-ss", str(pre),
+            "-i", mov, *trim,
+            "-c:v", "libx264", "-preset", preset, "-threads", "0", "-tune", "fastdecode",
+            *acodec, "-avoid_negative_ts", "1",
+            out,
+        ]
+
+    @staticmethod
+    def _keyframe_at(t: float, keyframes: list, window: float) -> float | None:
+        '''
+        Returns:
+        The first keyframe in [t, t + window), i.e. the frame a frame-accurate cut at t starts on, or None.
+        Grids that don't land on a frame (e.g. 10.01/3 at 30 fps) put forced keyframes up to a frame late.
+        '''
+        idx = bisect_left( keyframes, t - 1e-3 )
+        if idx < len(keyframes) and keyframes[ idx ] < t + window:
+            return keyframes[ idx ]
+        return None
+
+    @classmethod
+    def _on_keyframes(cls, times: list, keyframes: list, window: float) -> bool:
+        '''
+        Returns:
+        True if every time starts on a keyframe (see _keyframe_at), so a stream copy from there is frame-exact.
+        '''
+        return all( t <= 0 or cls._keyframe_at( t, keyframes, window ) is not None for t in times )
+
+    @staticmethod
+    def _is_uniform(segments: list, duration: float | None = None) -> bool:
+        '''
+        Returns:
+        True for back-to-back, equal length segments from 0 to the end of the clip (the last may be shorter).
+        '''
+        if duration is None or len(segments) < 2 or segments[0][ "start" ] != 0:
+            return False
+        length = segments[0][ "end" ] - segments[0][ "start" ]
+        for prev, segment in zip( segments, segments[1:] ):
+            if abs( segment[ "start" ] - prev[ "end" ] ) >= 0.01:
+                return False
+            if abs( ( prev[ "end" ] - prev[ "start" ] ) - length ) >= 0.01:
+                return False
+        last = segments[-1]
+        return last[ "end" ] - last[ "start" ] <= length + 0.01 and abs( last[ "end" ] - duration ) < 0.05
+
+    def _split_uniform(self, mov: str, segments: list, pth: str, nam: str, out_name: str, ext: str) -> list:
+        '''
+        Stream-copies the whole clip into equal chunks with ffmpeg's segment muxer, one process and one read of the source.
+        Callers must check that every boundary is a keyframe first, the muxer otherwise cuts late.
+
+        Returns:
+        The generated file paths, or an empty list if the muxer failed or its keyframe-aligned cuts didn't
+        produce exactly one file per segment.
+        '''
+        total  = len(segments)
+        length = segments[0][ "end" ] - segments[0][ "start" ]
+        tmp    = f"{nam}_{out_name}.tmp.{os.getpid()}"
+        tmps   = [ os.path.join( pth, f"{tmp}_{i:02}{ext}" ) for i in range(1, total+2) ]
+        outs   = [ os.path.join( pth, f"{nam}_{out_name}_{i:02}{ext}" ) for i in range(1, total+1) ]
+
+        cmd = [
+            "ffmpeg", "-y", "-i", mov,
+            "-f", "segment", "-segment_time", str(length), "-segment_time_delta", "0.01", "-segment_start_number", "1",
+            "-reset_timestamps", "1", "-c", "copy",
+            os.path.join( pth, f"{tmp}_%02d{ext}" ),
+        ]
+        try:
+            _run(cmd)
+            if all( os.path.exists(t) for t in tmps[:-1] ) and not os.path.exists( tmps[-1] ):
+                for t, out in zip( tmps, outs ):
+                    os.replace( t, out )
+                return outs
+        except subprocess.CalledProcessError:
+            pass
+        finally:
+            for t in tmps:
+                if os.path.exists(t):
+                    os.unlink(t)
+        return []
+
+    @staticmethod
+    def _muxer_rejected(stderr: str) -> bool:
+        return any( msg in stderr for msg in (
+            "Could not find tag for codec",
+            "not currently supported in container",
+            "Could not write header",
+        ) )
+
+    async def _encode_one(self, i: int, segment: dict, mov: str, pth: str, nam: str,
+                          out_name: str, ext: str, total: int, mode: str, duration: float | None = None,
+                          preset: str = "veryfast") -> str:
+        start = segment[ "start" ]
+        end   = segment[   "end" ]
+        sfx   = f'_{i:02}{ext}' if total > 1 else ext
+        out   = os.path.join( pth, f"{nam}_{out_name}{sfx}" )
+
+        with _atomic_output( out, i ) as tmp:
+            if mode == "copy" and av is not None:
+                try:
+                    await asyncio.to_thread( _av_copy, mov, start, end, tmp )
+                    return out
+                except (av.FFmpegError, OSError, ValueError):
+                    # Fall back to the ffmpeg cli for anything PyAV can't remux
+                    pass
+
+            audio = "copy"
+            while True:
+                cmd = self._build_cmd( mov, start, end, tmp, mode, audio, duration, preset )
+                try:
+                    await _run_async(cmd)
+                    break
+                except subprocess.CalledProcessError as e:
+                    stderr = ( e.stderr or b"" ).decode( errors="replace" )
+                    if mode != "copy" and audio == "copy" and self._muxer_rejected( stderr ):
+                        audio = "aac"
+                    elif mode == "nvenc":
+                        # A source h264_cuvid can't decode (e.g. HEVC/ProRes), redo this segment on CPU.
+                        # Other sources can still use NVENC, so leave _detect_hwaccel alone
+                        mode = "x264"
+                    else:
+                        raise
+        return out
+
     @activity(
         config={
-            "description": "Can create subclips of video files using start and end times",
+            "description": "Can create subclips of video files using start and end times. "
+                           "By default cuts are stream-copied and near-instant, starting on the nearest keyframe "
+                           "at or before each start time. Only set 'precise' when frame-accurate cuts are required",
             "schema": Schema(
                 {
                     Literal(
@@ -182,6 +700,15 @@ class VideoSplitterTool(BaseTool):
                         "output_name",
                         'Optional mid-suffix for output files, default will simply be "segment"',
                     ): Optional(str),
+                    Literal(
+                        "precise",
+                        "Optional, re-encode for frame-accurate cuts (much slower), default is false",
+                    ): Optional(bool),
+                    Literal(
+                        "preset",
+                        'Optional x264 preset for precise cuts, default is "veryfast" which takes roughly a quarter '
+                        'of the CPU time of "medium". Use a slower preset only for archival quality cuts',
+                    ): Optional( Or( "ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow" ) ),# pyright: ignore
                 }
             ),
         }
@@ -194,6 +721,8 @@ class VideoSplitterTool(BaseTool):
         mov      = params[ 'values' ][ 'mov'      ]
         segments = params[ 'values' ][ 'segments' ]
         out_name = params.get('values', {}).get( 'output_name', 'segment' )
+        precise  = params.get('values', {}).get( 'precise',     False     )
+        preset   = params.get('values', {}).get( 'preset',      'veryfast' )
 
         if not os.path.exists(mov):
             return ErrorArtifact( f"Error: File not found: {mov}" )
@@ -201,31 +730,148 @@ class VideoSplitterTool(BaseTool):
             return ErrorArtifact( f"Error: No segments provided." )
 
         # Parse the file path and name
-        pth, ext = os.path.splitext( mov )
-        pth, nam = os.path.split(    pth )
+        p = Path( mov )
+        pth, nam, ext = str(p.parent), p.stem, p.suffix
 
-        output_files = []
-        for i, segment in enumerate(segments, 1):
-            start = segment[ "start" ]
-            end   = segment[   "end" ]
-            sfx   = f'_{i:02}{ext}' if len(segments) > 1 else ext
-            out   = os.path.join( pth, f"{nam}_{out_name}{sfx}" )
+        try:
+            info = _probe( mov )
+        except (OSError, ValueError, KeyError, subprocess.CalledProcessError):
+            info = None
+        duration = info[ "duration" ] if info else None
+        window   = _frame_interval( info )
 
-            if os.path.exists(out):
-                print(f'Deleting existing "{out}"')
-                os.remove(out)
+        # Fail fast on segments ffmpeg would happily turn into empty files
+        invalid = _invalid_segments( segments, duration )
+        if invalid:
+            bounds = f"0 and {duration}" if duration is not None else "0 and the end of the clip"
+            return ErrorArtifact( f"Error: Segments must have start < end, between {bounds}: {invalid}" )
 
-            cmd = [
-                "ffmpeg", "-ss", str(start),
-                "-i", mov,  "-t", str(end-start), #str(end - (start-0.5)),
-                "-c:v", "libx264", "-avoid_negative_ts", "1",
-                out,
-            ]
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            output_files.append(out)
+        # A single segment spanning the whole clip is just a copy of the file, no ffmpeg needed
+        if ( duration is not None and len(segments) == 1
+                and segments[0][ "start" ] <= 0 and abs( segments[0][ "end" ] - duration ) < 0.05 ):
+            out = os.path.join( pth, f"{nam}_{out_name}{ext}" )
+            with _atomic_output( out ) as tmp:
+                shutil.copy( mov, tmp )
+            return TextArtifact( f"Clips successfully created: {out}" )
+
+        # When every start already sits on a keyframe (e.g. a prepare_for_split output), stream copy is exact too
+        starts = [ s[ "start" ] for s in segments ]
+        if precise and self._on_keyframes( starts, self._keyframes( mov ), window ):
+            precise = False
+
+        # The segment muxer can only cut on keyframes, so it's only exact when every boundary already is one
+        if ( not precise and self._is_uniform( segments, duration )
+                and self._on_keyframes( starts, self._keyframes( mov ), window ) ):
+            output_files = self._split_uniform( mov, segments, pth, nam, out_name, ext )
+            if output_files:
+                return TextArtifact( f"Clips successfully created: {', '.join(output_files)}" )
+
+        if precise:
+            mode = "nvenc" if _detect_hwaccel() else "x264"
+        else:
+            # Stream copy can only start on a keyframe, snap each start to one so the end stays put
+            mode      = "copy"
+            keyframes = self._keyframes( mov )
+            if keyframes:
+                snapped = []
+                for segment in segments:
+                    # A keyframe up to a frame late is where an exact cut would start anyway, otherwise go back one
+                    start = self._keyframe_at( segment[ "start" ], keyframes, window )
+                    if start is None:
+                        idx   = bisect_right( keyframes, segment[ "start" ] ) - 1
+                        start = keyframes[ idx ] if idx >= 0 else 0
+                    snapped.append( { "start": start, "end": segment[ "end" ] } )
+                segments = snapped
+
+        # Segments are independent ffmpeg runs, so fan them out. Copies are I/O bound and can go wide,
+        # x264 re-encodes already use every core and NVENC sessions are capped per GPU
+        total = len(segments)
+        if mode == "copy":
+            limit = min( 16, 2 * ( os.cpu_count() or 1 ) )
+        else:
+            limit = _NVENC_MAX_SESSIONS if mode == "nvenc" else _X264_MAX_JOBS
+
+        async def encode_all():
+            sem = asyncio.Semaphore( limit )
+
+            async def encode( i, segment ):
+                async with sem:
+                    return await self._encode_one( i, segment, mov, pth, nam, out_name, ext, total, mode, duration,
+                                                   preset )
+
+            return await asyncio.gather( *( encode( i, segment ) for i, segment in enumerate(segments, 1) ),
+                                         return_exceptions=True )
+
+        output_files, failures = [], []
+        for segment, result in zip( segments, _run_sync( encode_all() ) ):
+            if isinstance( result, subprocess.CalledProcessError ):
+                failures.append( f"{segment['start']}-{segment['end']}: {result} {result.stderr.decode(errors='replace')}" )
+            elif isinstance( result, BaseException ):
+                raise result
+            else:
+                output_files.append( result )
+
+        if failures:
+            return ErrorArtifact( f"Error creating clips: {'; '.join(failures)}" )
 
         return TextArtifact( f"Clips successfully created: {', '.join(output_files)}" )
 
+    @activity(
+        config={
+            "description": "Re-encodes a video once with a keyframe every 'segment_duration' seconds, so later splits "
+                           "on that grid are exact, near-instant stream copies. Use it before cutting the same video "
+                           "into fixed length chunks, then split the returned '.prepped' file",
+            "schema": Schema(
+                {
+                    Literal(
+                        "mov",
+                        "Path to the video file",
+                    ): str,
+                    Literal(
+                        "segment_duration",
+                        "Length of the chunks the video will be split into, in seconds",
+                    ): Or( int, float ),
+                }
+            ),
+        }
+    )
+    def prepare_for_split(self, params: dict) -> Union[TextArtifact, ErrorArtifact]:
+        '''
+        Returns:
+        A success message with the path to the prepared video file.
+        '''
+        mov     = params[ 'values' ][ 'mov'              ]
+        seg_dur = params[ 'values' ][ 'segment_duration' ]
+
+        if not os.path.exists(mov):
+            return ErrorArtifact( f"Error: File not found: {mov}" )
+        if seg_dur <= 0:
+            return ErrorArtifact( f"Error: Invalid segment_duration: {seg_dur}. It must be greater than zero." )
+
+        p   = Path( mov )
+        out = str( p.with_name( f"{p.stem}.prepped{p.suffix}" ) )
+        # Key on time rather than a frame count, a GOP of round(fps*seg_dur) frames drifts off the grid at NTSC rates
+        force = f"expr:gte(t,n_forced*{seg_dur})"
+
+        try:
+            with _atomic_output( out ) as tmp:
+                x264_cmd = [
+                    "ffmpeg", "-y", "-i", mov,
+                    "-c:v", "libx264", "-force_key_frames", force,
+                    "-c:a", "copy",
+                    tmp,
+                ]
+                nvenc_cmd = [
+                    "ffmpeg", "-y", "-hwaccel", "cuda", "-i", mov,
+                    "-c:v", "h264_nvenc", "-preset", "p4", "-force_key_frames", force, "-forced-idr", "1",
+                    "-c:a", "copy",
+                    tmp,
+                ]
+                _run_hw( nvenc_cmd, x264_cmd )
+            return TextArtifact( f"Video prepared for splitting: {out}" )
+        except subprocess.CalledProcessError as e:
+            return ErrorArtifact( f"Error preparing video for splitting: {e} {e.stderr.decode(errors='replace')}" )
+
 
 class AudioExtractorTool(BaseTool):
     @activity(
@@ -259,39 +905,26 @@ class AudioExtractorTool(BaseTool):
             return ErrorArtifact(f"Error: File not found: {mov}")
 
         # Determine the output audio file name
-        stb, ext = os.path.splitext( mov )
-        pth, nam = os.path.split( stb )
+        p = Path( mov )
 
         #Fuzzy logic and UX can create a cycle of extentions here - cleaning up
-        while True:
-            if out_name.lower().endswith('.mp3'):
-                print(f'Naming cleanup on: {out_name}')
-                out_name, ext = os.path.splitext( out_name )
-            else:
-                break
-
-        if not out_name:
-            out = os.path.join( pth, f"{nam}.mp3" )
-        else:
-            out = os.path.join( pth, f"{out_name}.mp3" )
+        out_name = re.sub( r'(?i)(\.mp3)+$', '', out_name or '' )
+        out      = str( p.parent / f"{out_name or p.stem}.mp3" )
 
-        # Ensure the output file does not already exist
-        if os.path.exists(out):
-            print(f'Deleting existing "{out}"')
-            os.remove(out)
+        # Source is already an mp3, extraction is just a copy
+        if p.suffix.lower() == ".mp3":
+            if os.path.abspath(out) != os.path.abspath(mov):
+                with _atomic_output( out ) as tmp:
+                    shutil.copy( mov, tmp )
+            return TextArtifact(f"Audio successfully extracted: {out}")
 
         # Use ffmpeg to extract audio
-        cmd = [
-            "ffmpeg", "-i", mov,
-            "-q:a", "0", "-map", "a",  # High-quality audio extraction
-            out,
-        ]
-
         try:
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+            with _atomic_output( out ) as tmp:
+                _run( [ "ffmpeg", "-y", "-i", mov, *_AUDIO_EXTRACT_ARGS, tmp ] )
             return TextArtifact(f"Audio successfully extracted: {out}")
         except subprocess.CalledProcessError as e:
-            return ErrorArtifact(f"Error extracting audio: {e}")
+            return ErrorArtifact(f"Error extracting audio: {e} {e.stderr.decode(errors='replace')}")
 
 
 class VideoTimecodeOverlayTool(BaseTool):
@@ -326,29 +959,154 @@ class VideoTimecodeOverlayTool(BaseTool):
             return ErrorArtifact(f"Error: File not found: {mov}")
 
         # Parse the file path and name
-        pth, ext = os.path.splitext(mov)
-        pth, nam = os.path.split(pth)
+        p = Path(mov)
+        pth, nam, ext = str(p.parent), p.stem, p.suffix
 
         # Define the output video file with a "_timecoded" suffix
         out = os.path.join(pth, f"{nam}{out_name}{ext}")
 
-        # Ensure the output file does not already exist
-        if os.path.exists(out):
-            print(f'Deleting existing "{out}"')
-            os.remove(out)
-
         # Use FFmpeg to add the timecode overlay
-        timecode_data   = "drawtext=text='%{pts\\:hms}'"
-        timecode_size   = "fontsize='48*(w/1920)'"
-        timecode_color  = "fontcolor=white"
-        timecode_offset = "x=(w-text_w-text_h*2):y=(h-text_h-text_h*2)"
-        cmd = [
-            "ffmpeg", "-i", mov, "-vf",
-            f"{timecode_data}:{timecode_size}:{timecode_color}:{timecode_offset}",
-            out
-        ]
         try:
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+            with _atomic_output( out ) as tmp:
+                cmd = [
+                    "ffmpeg", "-y", "-i", mov, "-vf", _TIMECODE_FILTER,
+                    tmp
+                ]
+                # Decode on NVDEC and encode on NVENC, only drawtext runs on the CPU
+                gpu_cmd = [
+                    "ffmpeg", "-y", "-hwaccel", "cuda", "-i", mov, "-vf", _TIMECODE_FILTER,
+                    "-c:v", "h264_nvenc", "-preset", "p4",
+                    tmp
+                ]
+                _run_hw( gpu_cmd, cmd )
             return TextArtifact(f"Timecode overlay added: {out}")
         except subprocess.CalledProcessError as e:
-            return ErrorArtifact(f"Error adding timecode overlay: {e}")
+            return ErrorArtifact(f"Error adding timecode overlay: {e} {e.stderr.decode(errors='replace')}")
+
+
+class VideoProcessingPipelineTool(BaseTool):
+    def _build_graph(self, segments: list, overlay: bool, has_audio: bool) -> str:
+        # One decode feeds every segment: split the stream, then trim (and overlay) each branch.
+        # drawtext runs before setpts so the overlay shows the source timecode
+        total = len(segments)
+        graph = [ f"[0:v]split={total}" + "".join( f"[v{i}]" for i in range(1, total+1) ) ]
+        if has_audio:
+            graph.append( f"[0:a]asplit={total}" + "".join( f"[a{i}]" for i in range(1, total+1) ) )
+
+        for i, segment in enumerate(segments, 1):
+            start = segment[ "start" ]
+            end   = segment[   "end" ]
+            chain = f"[v{i}]trim=start={start}:end={end}"
+            if overlay:
+                chain += f",{_TIMECODE_FILTER}"
+            graph.append( f"{chain},setpts=PTS-STARTPTS[s{i}]" )
+            if has_audio:
+                graph.append( f"[a{i}]atrim=start={start}:end={end},asetpts=PTS-STARTPTS[t{i}]" )
+        return ";".join(graph)
+
+    def _process_sequential(self, mov: str, segments: list, outs: list, overlay: bool) -> None:
+        for segment, out in zip( segments, outs ):
+            start = segment[ "start" ]
+            end   = segment[   "end" ]
+
+            cmd = [ "ffmpeg", "-y", "-ss", str(start), "-i", mov, "-t", str(end-start) ]
+            if overlay:
+                # Shift to source time for drawtext, then back so the clip starts at zero
+                cmd += [ "-vf", f"setpts=PTS+{start}/TB,{_TIMECODE_FILTER},setpts=PTS-STARTPTS" ]
+            cmd += [ "-c:v", "libx264", "-vsync", "passthrough", "-avoid_negative_ts", "1", out ]
+            _run(cmd)
+
+    @activity(
+        config={
+            "description": "Creates subclips of a video using start and end times, optionally adding a timecode "
+                           "overlay, all in a single ffmpeg pass. Prefer this over VideoSplitterTool followed by "
+                           "VideoTimecodeOverlayTool when both are needed",
+            "schema": Schema(
+                {
+                    Literal(
+                        "mov",
+                        "Path to the video file",
+                    ): str,
+                    Literal(
+                        "segments",
+                        "List of start and end times (list of dicts with 'start' and 'end')",
+                    ): [ { 'start': Or( int, float ),'end': Or( int, float ) } ],
+                    Literal(
+                        "output_name",
+                        'Optional mid-suffix for output files, default will simply be "segment"',
+                    ): Optional(str),
+                    Literal(
+                        "overlay",
+                        "Optional, burn the source timecode into each clip, default is false",
+                    ): Optional(bool),
+                }
+            ),
+        }
+    )
+    def process(self, params: dict) -> Union[TextArtifact, ErrorArtifact]:
+        '''
+        Returns:
+        A success message with the list of generated file paths.
+        '''
+        mov      = params[ 'values' ][ 'mov'      ]
+        segments = params[ 'values' ][ 'segments' ]
+        out_name = params.get('values', {}).get( 'output_name', 'segment' )
+        overlay  = params.get('values', {}).get( 'overlay',     False     )
+
+        if not os.path.exists(mov):
+            return ErrorArtifact( f"Error: File not found: {mov}" )
+        if not segments:
+            return ErrorArtifact( f"Error: No segments provided." )
+
+        # Parse the file path and name
+        p = Path( mov )
+        pth, nam, ext = str(p.parent), p.stem, p.suffix
+
+        try:
+            info = _probe(mov)
+        except (OSError, ValueError, KeyError, subprocess.CalledProcessError):
+            info = None
+        duration  = info[ "duration" ] if info else None
+        has_audio = any( s[ "type" ] == "audio" for s in info[ "streams" ] ) if info else False
+
+        invalid = _invalid_segments( segments, duration )
+        if invalid:
+            bounds = f"0 and {duration}" if duration is not None else "0 and the end of the clip"
+            return ErrorArtifact( f"Error: Segments must have start < end, between {bounds}: {invalid}" )
+
+        total = len(segments)
+        outs  = [
+            os.path.join( pth, f"{nam}_{out_name}" + ( f'_{i:02}{ext}' if total > 1 else ext ) )
+            for i in range(1, total+1)
+        ]
+
+        # Every output opens its own encoder, so only use NVENC while that stays within the session cap
+        use_nvenc = total <= _NVENC_MAX_SESSIONS and _detect_hwaccel()
+        vcodec    = "h264_nvenc" if use_nvenc else "libx264"
+        try:
+            with ExitStack() as stack:
+                tmps = [ stack.enter_context( _atomic_output( out, i ) ) for i, out in enumerate(outs, 1) ]
+
+                # Long lists (e.g. 2-second chunks of a long clip) would mean hundreds of encoders in one process,
+                # so only fuse short ones and run the rest one segment at a time
+                if total <= _FUSED_MAX_OUTPUTS:
+                    cmd = [ "ffmpeg", "-y", "-i", mov, "-filter_complex", self._build_graph( segments, overlay, has_audio ) ]
+                    for i, tmp in enumerate(tmps, 1):
+                        cmd += [ "-map", f"[s{i}]" ]
+                        if has_audio:
+                            cmd += [ "-map", f"[t{i}]" ]
+                        # Trimmed branches carry no frame rate, keep the source timestamps instead of resampling
+                        # to 25 fps. -vsync rather than -fps_mode, which only exists from ffmpeg 5.1
+                        cmd += [ "-c:v", vcodec, "-vsync", "passthrough", tmp ]
+
+                    try:
+                        _run(cmd)
+                    except subprocess.CalledProcessError:
+                        # Fall back to one ffmpeg run per segment
+                        self._process_sequential( mov, segments, tmps, overlay )
+                else:
+                    self._process_sequential( mov, segments, tmps, overlay )
+        except subprocess.CalledProcessError as e:
+            return ErrorArtifact( f"Error processing video: {e} {e.stderr.decode(errors='replace')}" )
+
+        return TextArtifact( f"Clips successfully created: {', '.join(outs)}" )